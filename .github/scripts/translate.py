@@ -7,27 +7,48 @@ Reads supported languages from src/i18n/routing.ts
 
 Features:
 - Uses requests library for speed (faster than official deepl lib)
-- Tracks value changes with MD5 hashes
+- Batches up to 50 texts per DeepL request
+- Translates target locales concurrently
+- Reuses pooled keep-alive connections with automatic retries
+- Backs off adaptively when DeepL rate-limits (HTTP 429)
+- Protects ICU placeholders ({name}) from being translated
+- Uses orjson for large catalogues when installed
+- Tracks value changes with BLAKE2b hashes
 - Only translates missing or changed keys
+- Caches translations per language, so repeated strings are billed once
 - Preserves existing translations
 - Proper error handling
 
 API Documentation: https://developers.deepl.com/docs/api-reference/translate
 """
+import asyncio
+import functools
 import hashlib
 import json
 import os
+import random
 import re
 import sys
+import threading
+import time
+import urllib.parse
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ Error: requests module not found")
     print("   Run: pip install requests")
     sys.exit(1)
 
+# orjson is optional, it just makes reading/writing large catalogues faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 DEEPL_API_KEY = os.environ.get("DEEPL_API_KEY")
 if not DEEPL_API_KEY:
@@ -40,6 +61,62 @@ DEEPL_URL = "https://api-free.deepl.com/v2/translate"
 LOCALES_DIR = Path("src/messages")
 ROUTING_FILE = Path("src/i18n/routing.ts")
 HASHES_FILE = Path("src/messages/.translation_hashes.json")
+CACHE_FILE = Path("src/messages/.translation_cache.json")
+
+# DeepL request limits: max 50 texts and 128 KiB body per request
+MAX_TEXTS_PER_REQUEST = 50
+MAX_REQUEST_BYTES = 120 * 1024  # leave headroom for the other form fields
+
+# Values matching these are copied to targets without calling DeepL
+NUMERIC_RE = re.compile(r"^[\d\s.,:%+\-/]+$")
+PLACEHOLDER_ONLY_RE = re.compile(r"^(\{[^}]+\}|\s)+$")
+
+# ICU placeholders are sent as ignored XML tags so DeepL keeps them intact
+PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+PH_TAG_RE = re.compile(r'<ph id="(\w+)"\s*(?:/>|></ph>)')
+SPLITTING_TAGS = "p,br,li,div"
+NON_SPLITTING_TAGS = "strong,em,b,i,code,span,a"
+
+# Only texts with known markup or placeholders are sent in XML mode; there,
+# any other &, < and > (e.g. "&&" or "https://<IP>") is escaped
+MARKUP_TAG_RE = re.compile(r"</?(?:%s)(?:\s[^<>]*)?/?>" % "|".join(
+    SPLITTING_TAGS.split(",") + NON_SPLITTING_TAGS.split(",")))
+XML_SPECIAL_RE = re.compile(r"(%s)|[&<>]" % MARKUP_TAG_RE.pattern)
+XML_ENTITY_RE = re.compile(r"&(amp|lt|gt);")
+XML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+XML_UNESCAPES = {"amp": "&", "lt": "<", "gt": ">"}
+
+# Number of locales translated in parallel (DeepL is fine with ~10)
+MAX_CONCURRENT_LOCALES = 4
+
+# Adaptive throttling: the delay between requests grows on 429 and
+# recovers after THROTTLE_COOLDOWN_COUNT successful calls
+THROTTLE_BACKOFF_FACTOR = 1.5
+THROTTLE_RECOVER_FACTOR = 0.75
+THROTTLE_MIN_REQUEST_INTERVAL = 0.05
+THROTTLE_MAX_REQUEST_INTERVAL = 2.0
+THROTTLE_COOLDOWN_COUNT = 3
+THROTTLE_BASE_DELAY = 0.5
+THROTTLE_MAX_ATTEMPTS = 8
+
+CURRENT_INTERVAL = THROTTLE_MIN_REQUEST_INTERVAL
+NEXT_REQUEST_AT = 0.0  # time.monotonic() before which no worker may send
+THROTTLE_GOOD_CALLS = THROTTLE_COOLDOWN_COUNT
+THROTTLE_LOCK = threading.Lock()
+
+# Shared session so all requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers["Authorization"] = f"DeepL-Auth-Key {DEEPL_API_KEY}"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],  # 429 is handled by throttling
+        allowed_methods=["POST"],  # translate is idempotent, retry it too
+    ),
+))
 
 # DeepL language code mapping (from official API docs)
 # Source: https://developers.deepl.com/docs/api-reference/languages
@@ -58,38 +135,52 @@ DEEPL_LANG_CODES = {
     # Add more as needed
 }
 
+@functools.lru_cache(maxsize=None)
 def get_hash(text: str) -> str:
-    """Generate MD5 hash of text for change tracking"""
-    return hashlib.md5(str(text).encode('utf-8')).hexdigest()[:8]
+    """Generate BLAKE2b hash of text for change tracking (8 hex chars)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=4).hexdigest()
+
+def get_legacy_hash(text: str) -> str:
+    """Generate the MD5 hash used by older versions of this script"""
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
+
+def load_json(path: Path) -> dict:
+    """Read a JSON file, using orjson when available"""
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
 
 def load_hashes() -> dict:
     """Load existing hashes from .translation_hashes.json"""
     if HASHES_FILE.exists():
         try:
-            with open(HASHES_FILE, encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(HASHES_FILE)
         except:
             return {}
     return {}
 
+def write_json(path: Path, data: dict):
+    """Write JSON atomically via a temp file, so an abort never truncates it
+
+    Keys are sorted so output is deterministic and diffs stay small.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    if orjson:
+        tmp.write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
 def save_hashes(hashes: dict):
     """Save hashes to .translation_hashes.json"""
-    with open(HASHES_FILE, "w", encoding="utf-8") as f:
-        json.dump(hashes, f, ensure_ascii=False, indent=2)
-
-def get_nested_value(obj: dict, path: str):
-    """Get value from nested dict using dot notation path"""
-    keys = path.split('.')
-    current = obj
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
-            return None
-    return current
+    write_json(HASHES_FILE, hashes)
 
-def get_locales_from_routing():
-    """Extract locales array from routing.ts"""
+def parse_routing() -> tuple:
+    """Extract (locales, default locale) from routing.ts in a single read"""
     if not ROUTING_FILE.exists():
         print(f"❌ Error: {ROUTING_FILE} not found")
         sys.exit(1)
@@ -106,13 +197,33 @@ def get_locales_from_routing():
     locales_str = match.group(1)
     locales = re.findall(r"'([a-z]{2})'", locales_str)
 
-    return locales
-
-def get_default_locale():
-    """Extract default locale from routing.ts"""
-    content = ROUTING_FILE.read_text(encoding="utf-8")
     match = re.search(r"defaultLocale\s*:\s*'([a-z]{2})'", content)
-    return match.group(1) if match else "de"
+    default_locale = match.group(1) if match else "de"
+
+    return locales, default_locale
+
+def load_cache() -> dict:
+    """Load translation cache from .translation_cache.json"""
+    if CACHE_FILE.exists():
+        try:
+            return load_json(CACHE_FILE)
+        except:
+            return {}
+    return {}
+
+def save_cache(cache: dict):
+    """Save translation cache to .translation_cache.json"""
+    write_json(CACHE_FILE, cache)
+
+@functools.lru_cache(maxsize=None)
+def get_cache_key(text: str, target_lang: str) -> str:
+    """Build the translation cache key for a source text and DeepL language
+
+    Uses a wider digest than get_hash, since a collision here would copy
+    a wrong translation instead of merely re-translating a key.
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+    return f"{target_lang}:{digest}"
 
 def get_all_namespaces():
     """Get all JSON files - using flat structure (de.json, en.json, ru.json)"""
@@ -123,48 +234,202 @@ def get_all_namespaces():
     # Flat structure - single file per language
     return ["messages"]
 
-def translate_text(text: str, target_lang: str, source_lang: str = None) -> str:
-    """Translate text using DeepL REST API (requests library for speed)"""
+def is_skipped(text: str) -> bool:
+    """Check whether a value is passed through untranslated"""
     if not text.strip():
-        return text
+        return True
 
     # Skip if already contains HTML/React placeholders
     if text.startswith("__") and text.endswith("__"):
-        return text
-
+        return True
+
+    # Nothing to translate in numbers or bare ICU placeholders like "{count}"
+    return bool(NUMERIC_RE.match(text) or PLACEHOLDER_ONLY_RE.match(text))
+
+@functools.lru_cache(maxsize=None)
+def encode_placeholders(text: str) -> str:
+    """Prepare text for XML tag handling
+
+    Escapes &, < and > outside of known markup and wraps top-level ICU
+    placeholders like {name} as <ph id="name"/> tags. Placeholders nested
+    inside plural/select branches are left alone, since those braces hold
+    translatable text.
+    """
+    escaped = XML_SPECIAL_RE.sub(
+        lambda match: match.group(1) or XML_ESCAPES[match.group(0)], text)
+
+    def replace(match):
+        before = escaped[:match.start()]
+        if before.count("{") != before.count("}"):
+            return match.group(0)
+        return f'<ph id="{match.group(1)}"/>'
+
+    return PLACEHOLDER_RE.sub(replace, escaped)
+
+def decode_placeholders(text: str) -> str:
+    """Turn <ph id="name"/> tags back into ICU placeholders and unescape"""
+    text = PH_TAG_RE.sub(r"{\1}", text)
+    return XML_ENTITY_RE.sub(lambda match: XML_UNESCAPES[match.group(1)], text)
+
+def needs_xml(text: str) -> bool:
+    """Check whether a text has markup or placeholders needing XML mode"""
+    return bool(MARKUP_TAG_RE.search(text)) or "<ph " in encode_placeholders(text)
+
+def chunk_texts(texts: list, xml: bool = False) -> list:
+    """Split texts into chunks that respect DeepL's per-request limits"""
+    chunks = []
+    current = []
+    current_size = 0
+
+    for text in texts:
+        # Measure what is actually sent: XML-encoded if needed, form-urlencoded
+        sent = encode_placeholders(text) if xml else text
+        size = len("&text=") + len(urllib.parse.quote_plus(sent))
+        if current and (len(current) >= MAX_TEXTS_PER_REQUEST
+                        or current_size + size > MAX_REQUEST_BYTES):
+            chunks.append(current)
+            current = []
+            current_size = 0
+        current.append(text)
+        current_size += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+def throttle_wait():
+    """Wait for this worker's request slot, spacing requests across all workers"""
+    global NEXT_REQUEST_AT
+    with THROTTLE_LOCK:
+        now = time.monotonic()
+        start = max(now, NEXT_REQUEST_AT)
+        NEXT_REQUEST_AT = start + CURRENT_INTERVAL
+    time.sleep(start - now)
+
+def throttle_backoff(delay: float):
+    """Grow the inter-request delay and pause all workers after a 429"""
+    global CURRENT_INTERVAL, NEXT_REQUEST_AT, THROTTLE_GOOD_CALLS
+    with THROTTLE_LOCK:
+        CURRENT_INTERVAL = min(THROTTLE_MAX_REQUEST_INTERVAL,
+                               CURRENT_INTERVAL * THROTTLE_BACKOFF_FACTOR)
+        NEXT_REQUEST_AT = max(NEXT_REQUEST_AT, time.monotonic() + delay)
+        THROTTLE_GOOD_CALLS = THROTTLE_COOLDOWN_COUNT
+
+def get_retry_after(response) -> float:
+    """Return the Retry-After delay in seconds, or None if not sent"""
     try:
-        # Build request data according to API docs
-        data = {
-            "text": text,
-            "target_lang": target_lang,
-        }
-
-        # Optionally set source language
-        if source_lang:
-            data["source_lang"] = source_lang
-
-        # Only set tag_handling if text contains HTML/XML tags
-        if "<" in text and ">" in text:
-            data["tag_handling"] = "xml"
-            data["preserve_formatting"] = True
-
-        response = requests.post(
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+def throttle_recover():
+    """Shrink the inter-request delay again after enough good calls"""
+    global CURRENT_INTERVAL, THROTTLE_GOOD_CALLS
+    with THROTTLE_LOCK:
+        THROTTLE_GOOD_CALLS -= 1
+        if THROTTLE_GOOD_CALLS <= 0:
+            CURRENT_INTERVAL = max(THROTTLE_MIN_REQUEST_INTERVAL,
+                                   CURRENT_INTERVAL * THROTTLE_RECOVER_FACTOR)
+            THROTTLE_GOOD_CALLS = THROTTLE_COOLDOWN_COUNT
+
+def translate_batch(texts: list, target_lang: str, source_lang: str = None,
+                    xml: bool = False) -> list:
+    """Translate a list of texts in one DeepL REST API request
+
+    With xml, texts are sent with tag handling and placeholders protected.
+    Retries with exponential back-off on 429 and raises once retries are
+    exhausted, so untranslated source text never ends up in the catalogue.
+    """
+    if xml:
+        texts = [encode_placeholders(text) for text in texts]
+
+    # Build request data according to API docs (repeated "text" fields)
+    data = {
+        "text": texts,
+        "target_lang": target_lang,
+        "preserve_formatting": "1",
+    }
+
+    # Optionally set source language
+    if source_lang:
+        data["source_lang"] = source_lang
+
+    if xml:
+        data["tag_handling"] = "xml"
+        data["ignore_tags"] = "ph"
+        data["splitting_tags"] = SPLITTING_TAGS
+        data["non_splitting_tags"] = NON_SPLITTING_TAGS
+
+    for attempt in range(THROTTLE_MAX_ATTEMPTS):
+        throttle_wait()
+
+        response = SESSION.post(
             DEEPL_URL,
-            headers={"Authorization": f"DeepL-Auth-Key {DEEPL_API_KEY}"},
             data=data,
             timeout=30
         )
-        response.raise_for_status()
-        return response.json()["translations"][0]["text"]
 
-    except requests.exceptions.RequestException as e:
-        print(f"      ❌ Translation error: {e}")
-        return text  # Return original on error
+        if response.status_code == 429:
+            # Prefer the server's Retry-After, else exponential back-off
+            delay = get_retry_after(response)
+            if delay is None:
+                delay = min(THROTTLE_MAX_REQUEST_INTERVAL,
+                            THROTTLE_BASE_DELAY * THROTTLE_BACKOFF_FACTOR ** attempt)
+            delay += random.uniform(0, 0.25)
+            print(f"      ⏳ Rate limited ({target_lang}), retrying in {delay:.2f}s")
+            throttle_backoff(delay)
+            continue
+
+        response.raise_for_status()
+        throttle_recover()
+
+        # Translations are returned in the same order as the input texts
+        translated = [t["text"] for t in response.json()["translations"]]
+        if xml:
+            translated = [decode_placeholders(text) for text in translated]
+        return translated
+
+    response.raise_for_status()
+
+def translate_texts(texts: list, target_lang: str, source_lang: str = None) -> list:
+    """Translate texts in as few requests as possible, preserving order
+
+    Plain texts and texts needing XML tag handling go in separate requests.
+    """
+    translated = [None] * len(texts)
+    for xml in (False, True):
+        indices = [i for i, text in enumerate(texts) if needs_xml(text) == xml]
+        results = []
+        for chunk in chunk_texts([texts[i] for i in indices], xml):
+            results.extend(translate_batch(chunk, target_lang, source_lang, xml))
+        for i, result in zip(indices, results):
+            translated[i] = result
+    return translated
+
+async def translate_locale(semaphore: asyncio.Semaphore, locale: str, texts: list,
+                           target_lang: str, source_lang: str = None) -> list:
+    """Translate one locale's texts in a worker thread, bounded by semaphore"""
+    async with semaphore:
+        return await asyncio.to_thread(translate_texts, texts, target_lang, source_lang)
+
+async def translate_locales(jobs: list, source_lang: str = None) -> dict:
+    """Translate (locale, texts, target_lang) jobs concurrently
+
+    Returns locale -> translated texts, or the exception that locale raised,
+    so one failing locale does not discard the others' (billed) results.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOCALES)
+    tasks = [
+        asyncio.create_task(translate_locale(semaphore, locale, texts, target_lang, source_lang))
+        for locale, texts, target_lang in jobs
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return {locale: result for (locale, _, _), result in zip(jobs, results)}
 
 def collect_all_keys(data: dict, prefix: str = "") -> dict:
-    """Collect all keys with their values from nested structure"""
+    """Collect all keys with their values from nested structure (sorted)"""
     result = {}
-    for key, value in data.items():
+    for key, value in sorted(data.items()):
         current_path = f"{prefix}.{key}" if prefix else key
         if isinstance(value, dict):
             result.update(collect_all_keys(value, current_path))
@@ -176,8 +441,7 @@ def main():
     print("🌍 Starting DeepL Auto-Translation (using requests with hash tracking)...")
 
     # Get locales from routing.ts
-    all_locales = get_locales_from_routing()
-    default_locale = get_default_locale()
+    all_locales, default_locale = parse_routing()
     source_lang_code = default_locale.upper()  # DeepL source lang (e.g., 'de' -> 'DE')
 
     print(f"   Source locale: {default_locale}")
@@ -200,7 +464,14 @@ def main():
 
     # Load existing hashes
     hashes = load_hashes()
+    stored_hashes = dict(hashes)
+    cache = load_cache()
+    stored_cache_size = len(cache)
     total_translations = 0
+    total_cache_hits = 0
+    total_deduplicated = 0
+    total_characters = 0
+    total_changed = 0
 
     for ns in namespaces:
         src_file = LOCALES_DIR / f"{default_locale}.json"
@@ -209,8 +480,7 @@ def main():
             print(f"⚠️  Skipping {ns} - source file not found")
             continue
 
-        with open(src_file, encoding="utf-8") as f:
-            src_data = json.load(f)
+        src_data = load_json(src_file)
 
         print(f"📦 Processing: {src_file}")
         print(f"   Total namespaces: {len(src_data)}")
@@ -218,24 +488,22 @@ def main():
         # Collect all keys from source (flattened)
         src_keys = collect_all_keys(src_data)
 
-        # Track changed keys to re-translate (hash mismatch)
-        changed_keys_set = set()
-
-        # Check for changed values in source and update hashes
-        for key_path, value in src_keys.items():
-            current_hash = get_hash(str(value))
-            stored_hash = hashes.get(key_path)
-
-            if stored_hash and stored_hash != current_hash:
-                # Hash changed - source value was modified
-                changed_keys_set.add(key_path)
-                print(f"   🔑 Changed key detected: {key_path}")
+        # Hash all source values once; keys with a stored, different hash
+        # were modified in source and must be re-translated
+        new_hashes = {k: get_hash(str(v)) for k, v in src_keys.items()}
+        # (a stored MD5 hash of the same value is not a change, it is
+        # simply rewritten as BLAKE2b on this run)
+        changed_keys_set = {
+            k for k, h in new_hashes.items()
+            if k in hashes and hashes[k] != h
+            and hashes[k] != get_legacy_hash(str(src_keys[k]))
+        }
 
-            # Always update hash to current value
-            hashes[key_path] = current_hash
+        for key_path in sorted(changed_keys_set):
+            print(f"   🔑 Changed key detected: {key_path}")
 
-        # Count total changed keys (once, not per language)
-        changed_keys_count = len(changed_keys_set)
+        # Locales with work to do, translated together below
+        pending = []
 
         for target_locale in target_locales:
             # Get DeepL language code
@@ -248,11 +516,13 @@ def main():
 
             # Load existing translations
             try:
-                with open(target_file, encoding="utf-8") as f:
-                    target_data = json.load(f)
+                target_data = load_json(target_file)
             except:
                 target_data = {}
 
+            # Flatten once so each key lookup is a single dict access
+            flat_target = collect_all_keys(target_data)
+
             # WARNING: Do NOT auto-remove orphaned keys!
             # Keys may exist in translations but not in source (de.json)
             # If they're used in code, removing them will break the app
@@ -262,7 +532,7 @@ def main():
             missing_or_changed = []
 
             for key_path, value in src_keys.items():
-                target_value = get_nested_value(target_data, key_path)
+                target_value = flat_target.get(key_path)
 
                 # Missing key
                 if target_value is None:
@@ -277,15 +547,60 @@ def main():
                 print(f"   {target_locale}: ✅ All keys present and up-to-date")
                 continue
 
+            # Skipped values (empty, placeholders, numbers) are copied as-is,
+            # cached translations are reused, only the rest is sent in batches
+            texts = [str(value) for _, value, _ in missing_or_changed
+                     if not is_skipped(str(value))]
+            uncached = [text for text in texts
+                        if get_cache_key(text, dl_lang_code) not in cache]
+            cache_misses = list(dict.fromkeys(uncached))
+            total_cache_hits += len(texts) - len(uncached)
+            total_deduplicated += len(uncached) - len(cache_misses)
+            total_characters += sum(len(text) for text in cache_misses)
+            pending.append((target_locale, target_file, target_data,
+                            missing_or_changed, cache_misses, dl_lang_code))
+
+        # Translate all locales concurrently
+        results = asyncio.run(translate_locales(
+            [(locale, texts, dl_lang_code)
+             for locale, _, _, _, texts, dl_lang_code in pending],
+            source_lang_code
+        ))
+
+        failed = False
+        for target_locale, _, _, _, cache_misses, dl_lang_code in pending:
+            result = results[target_locale]
+            if isinstance(result, BaseException):
+                print(f"   {target_locale}: ❌ Translation error: {result}")
+                failed = True
+                continue
+            for text, translated in zip(cache_misses, result):
+                cache[get_cache_key(text, dl_lang_code)] = translated
+
+        if failed:
+            # Keep what was paid for, but leave catalogues and hashes alone
+            # so the next run retries (and gets the rest from the cache)
+            save_cache(cache)
+            sys.exit(1)
+
+        for target_locale, target_file, target_data, missing_or_changed, _, dl_lang_code in pending:
+            changed_keys_count = sum(1 for _, _, reason in missing_or_changed
+                                     if reason == "changed")
+            total_changed += changed_keys_count
+
             print(f"   {target_locale}: Translating {len(missing_or_changed)} keys", end="")
             if changed_keys_count > 0:
                 print(f" (including {changed_keys_count} changed)")
             else:
                 print()
 
-            # Translate missing or changed keys
+            dirty = False
+
             for full_path, value, reason in missing_or_changed:
-                translated = translate_text(str(value), dl_lang_code, source_lang_code)
+                if is_skipped(str(value)):
+                    translated = str(value)
+                else:
+                    translated = cache[get_cache_key(str(value), dl_lang_code)]
 
                 # Build nested structure and set value
                 parts = full_path.split('.')
@@ -298,28 +613,40 @@ def main():
                     current = current[part]
 
                 # Set the translated value
-                current[parts[-1]] = translated
+                if current.get(parts[-1]) != translated:
+                    current[parts[-1]] = translated
+                    dirty = True
 
                 status_icon = "🔄" if reason == "changed" else "✓"
                 print(f"      {status_icon} {full_path}")
                 total_translations += 1
 
-            # Save updated translations
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(target_file, "w", encoding="utf-8") as f:
-                json.dump(target_data, f, ensure_ascii=False, indent=2)
+            # Save updated translations (only if something actually changed)
+            if not dirty:
+                print(f"   {target_locale}: ✅ No changes to save")
+                continue
+
+            write_json(target_file, target_data)
 
             print(f"   {target_locale}: ✅ Saved translations")
 
+        # Only record new hashes once every locale has been translated
+        hashes.update(new_hashes)
+
         print()
 
-    # Save updated hashes
-    save_hashes(hashes)
+    # Save updated cache and hashes (cache entries are only ever added)
+    if len(cache) != stored_cache_size:
+        save_cache(cache)
+    if hashes != stored_hashes:
+        save_hashes(hashes)
 
     print(f"✅ Translation complete!")
     print(f"   Total translations: {total_translations}")
-    print(f"   Changed keys re-translated: {changed_keys_count}")
-    print(f"   DeepL quota used: ~{total_translations} characters")
+    print(f"   Changed keys re-translated: {total_changed}")
+    print(f"   Served from translation cache: {total_cache_hits}")
+    print(f"   Duplicates translated once: {total_deduplicated}")
+    print(f"   DeepL quota used: ~{total_characters} characters")
 
 if __name__ == "__main__":
     main()